@@ -93,6 +93,19 @@ class Position:
             p: The :class:`Position` object to calculate the distance to
         """
         return sqrt((self.x - p.x)**2 + (self.y - p.y)**2)
+
+    def distanceSquaredTo(self, p: 'Position') -> float:
+        """
+        Returns the squared euclidean distance of this :class:`Position` to `p`,
+        measured in square meters. Comparing squared distances avoids the
+        square root calculation of :meth:`distanceTo`.
+
+        Args:
+            p: The :class:`Position` object to calculate the squared distance to
+        """
+        dx = self._x - p._x
+        dy = self._y - p._y
+        return dx*dx + dy*dy
     
     def __repr__(self):
         return "{}Position({},{})".format(ownerPrefix(self._owner), self.x, self.y)
@@ -21,6 +21,8 @@ class FsplAttenuation(PositionalAttenuationModel):
     A free-space path loss (FSPL) :class:`AttenuationModel` implementation
     """
 
+    __slots__ = ()
+
     def __init__(self, frequencyBandSpec: FrequencyBandSpec, deviceA: Device, deviceB: Device):
         super(FsplAttenuation, self).__init__(frequencyBandSpec, deviceA, deviceB)
         self._update()
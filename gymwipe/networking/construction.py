@@ -107,7 +107,8 @@ class Gate:
         Triggers :attr:`nReceives` with the provided object and sends it to all
         connected gates.
         """
-        logger.debug("Received object: %s", object, sender=self)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received object: %s", object, sender=self)
         self.nReceives.trigger(object)
 
 
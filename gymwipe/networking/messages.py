@@ -39,6 +39,8 @@ class Transmittable:
         byteSize: The transmittable's byteSize as it was passed to the constructor
     """
 
+    __slots__ = ("value", "byteSize")
+
     def __init__(self, value: Any, byteSize = None):
         """
         Args:
@@ -81,6 +83,8 @@ class FakeTransmittable(Transmittable):
     its size has to be considered.
     """
 
+    __slots__ = ()
+
     def __init__(self, byteSize: int):
         """
         Args:
@@ -110,6 +114,8 @@ class Packet(Transmittable):
     .. automethod:: __str__
     """
 
+    __slots__ = ("header", "payload", "trailer")
+
     def __init__(self, header: Transmittable, payload: Transmittable, trailer: Transmittable = None):
         self.header = header
         self.payload = payload
@@ -140,6 +146,8 @@ class SimpleMacHeader(Transmittable):
         flag(int): A single byte flag (stored as an integer in range(256))
     """
 
+    __slots__ = ("sourceMAC", "destMAC", "flag")
+
     def __init__(self, sourceMAC: bytes, destMAC: bytes, flag: int):
         if len(sourceMAC) != 6:
             raise ValueError("sourceMAC: Expected 6 bytes, got {:d}.".format(len(sourceMAC)))
@@ -169,6 +177,8 @@ class SimpleNetworkHeader(Transmittable):
         destMAC(bytes): The 6-byte-long destination MAC address
     """
 
+    __slots__ = ("sourceMAC", "destMAC")
+
     def __init__(self, sourceMAC: bytes, destMAC: bytes):
         if len(sourceMAC) != 6:
             raise ValueError("sourceMAC: Expected 6 bytes, got {:d}.".format(len(destMAC)))
@@ -2,14 +2,14 @@
 Physical-layer-related components
 """
 import functools
+import heapq
 import logging
 from abc import ABC, abstractmethod
-from collections import deque
 from fractions import Fraction
-from math import e, exp, log10, pi, sqrt
-from typing import Any, Deque, Dict, FrozenSet, List, Tuple, Type, TypeVar
+from itertools import count
+from math import exp, log10, pi, sqrt
+from typing import Any, Dict, List, Tuple, Type, TypeVar
 
-from scipy.special import binom
 from simpy import Event
 
 import gymwipe.devices as devices
@@ -55,7 +55,7 @@ def approxQFunction(x: float) -> float:
         x: The :math:`x` value to approximate :math:`Q(x)` for
     """
     assert x >= 0
-    return (1 - e**(-1.4*x)) * e**(-(x**2 / 2)) / (1.135 * sqrtOfTwoPi * x)
+    return (1 - exp(-1.4*x)) * exp(-0.5*x*x) / (1.135 * sqrtOfTwoPi * x)
 
 def temperatureToNoisePowerDensity(temperature: float) -> float:
     """
@@ -128,6 +128,10 @@ class Mcs(ABC):
         forward error correction
         """
 
+        # the max. correctable BER only depends on the code rate, so it is
+        # calculated once per instance
+        self._maxCorrectableBer = self._calculateMaxCorrectableBer(codeRate)
+
     @abstractmethod
     def calculateBitErrorRate(self, signalPower: float, noisePower: float, bitRate: float) -> float:
         """
@@ -163,25 +167,33 @@ class Mcs(ABC):
         MCS. It depends on the codeRate and is calculated via the
         Varshamov-Gilbert bound.
         """
+        return self._maxCorrectableBer
+
+    @staticmethod
+    def _calculateMaxCorrectableBer(codeRate: Fraction) -> float:
         # check for cached result
-        if self.codeRate in Mcs._codeRateToMaxCorrectableBer:
-            return Mcs._codeRateToMaxCorrectableBer[self.codeRate]
+        if codeRate in Mcs._codeRateToMaxCorrectableBer:
+            return Mcs._codeRateToMaxCorrectableBer[codeRate]
 
-        k = self.codeRate.numerator
-        n = self.codeRate.denominator
+        k = codeRate.numerator
+        n = codeRate.denominator
         bound = 2**(n-k)
 
         # find max. t with sum of binomial coefficients less or equal than bound
+        # (binomial coefficients are computed via the exact integer recurrence
+        # C(n,t+1) = C(n,t) * (n-t) / (t+1))
         currentSum = 0
+        binomCoefficient = 1 # C(n,0)
         t = 0
         while currentSum <= bound:
-            currentSum += binom(n, t)
+            currentSum += binomCoefficient
+            binomCoefficient = binomCoefficient * (n-t) // (t+1)
             t += 1
         t -= 1
         
         # up to t errors can be corrected in a block of n bits
         maxBer = float(t)/n
-        Mcs._codeRateToMaxCorrectableBer[self.codeRate] = maxBer
+        Mcs._codeRateToMaxCorrectableBer[codeRate] = maxBer
         return maxBer
 
 class BpskMcs(Mcs):
@@ -195,7 +207,8 @@ class BpskMcs(Mcs):
         # fixed bit rates for now
         self._bitRate = 133.33333e3 # 100 Kb/s data rate at 3/4 code rate
         self._dataRate = float(codeRate) * self._bitRate
-        
+        # the bit rate in dB, as subtracted by calculateEbToN0Ratio
+        self._bitRateDb = 10*log10(self._bitRate)
     
     @property
     def bitRate(self) -> float:
@@ -208,8 +221,11 @@ class BpskMcs(Mcs):
     def calculateBitErrorRate(self, signalPower: float, noisePower: float) -> float:
         if signalPower <= noisePower:
             return 0.5
-        ratio = calculateEbToN0Ratio(signalPower, noisePower, self._bitRate)
-        return approxQFunction(sqrt(2*ratio))
+        # equivalent to calculateEbToN0Ratio(signalPower, noisePower, self._bitRate)
+        ratio = 10**((signalPower - noisePower - self._bitRateDb)/10)
+        # approxQFunction(x) for x = sqrt(2*ratio), using x*x/2 == ratio
+        x = sqrt(2*ratio)
+        return (1 - exp(-1.4*x)) * exp(-ratio) / (1.135 * sqrtOfTwoPi * x)
 
 class Transmission:
     """
@@ -221,6 +237,10 @@ class Transmission:
         :meth:`FrequencyBand.transmit`.
     """
 
+    __slots__ = ("sender", "power", "mcsHeader", "mcsPayload", "packet", "startTime",
+                 "headerDuration", "payloadDuration", "duration", "stopTime",
+                 "headerBits", "payloadBits", "_eHeaderCompletes", "_eCompletes")
+
     def __init__(self, sender: Device, power: float, packet: Packet, mcsHeader: Mcs, mcsPayload: Mcs, startTime: float):
         
         self.sender: Device = sender
@@ -241,10 +261,13 @@ class Transmission:
         self.startTime: float = startTime
         """float: The simulated time at which the transmission started"""
 
-        self.headerDuration = packet.header.bitSize / mcsHeader.dataRate
+        headerBitSize = packet.header.bitSize
+        payloadBitSize = packet.payload.bitSize
+
+        self.headerDuration = headerBitSize / mcsHeader.dataRate
         """float: The time in seconds taken by the transmission of the packet's header"""
 
-        self.payloadDuration = packet.payload.bitSize / mcsPayload.dataRate
+        self.payloadDuration = payloadBitSize / mcsPayload.dataRate
         """float: The time in seconds taken by the transmission of the packet's payload"""
 
         self.duration = self.headerDuration + self.payloadDuration
@@ -256,27 +279,15 @@ class Transmission:
         completed
         """
 
-        self.headerBits = packet.header.bitSize * float(2 - mcsHeader.codeRate)
+        self.headerBits = headerBitSize * (2 - float(mcsHeader.codeRate))
         """Transmitted bits for the packet's header (including coding overhead)"""
 
-        self.payloadBits = packet.payload.bitSize * float(2 - mcsPayload.codeRate)
+        self.payloadBits = payloadBitSize * (2 - float(mcsPayload.codeRate))
         """Transmitted bits for the packet's payload (including coding overhead)"""
 
-        # SimPy events
-        headerStopTime = self.startTime + self.headerDuration
-        self.eHeaderCompletes: Event = SimMan.timeoutUntil(headerStopTime, self)
-        """
-        :class:`~simpy.events.Event`: A SimPy event that succeeds at the moment
-        in simulated time right after the packet's header has been transmitted.
-        The transmission object is provided as the value to the
-        :meth:`~simpy.events.Event.succeed` call.
-        """
-
-        self.eCompletes: Event = SimMan.timeoutUntil(self.stopTime, self)
-        """
-        :class:`~simpy.events.Event`: A SimPy event that succeeds at
-        :attr:`stopTime`, providing the transmission object as the value.
-        """
+        # SimPy events (created on first access)
+        self._eHeaderCompletes: Event = None
+        self._eCompletes: Event = None
         
     def __repr__(self):
         return "Transmission(sender: {}, power: {} dBm, duration: {} s)".format(self.sender, self.power, self.duration)
@@ -289,12 +300,37 @@ class Transmission:
         """
         return SimMan.now >= self.stopTime
 
+    @property
+    def eHeaderCompletes(self) -> Event:
+        """
+        :class:`~simpy.events.Event`: A SimPy event that succeeds at the moment
+        in simulated time right after the packet's header has been transmitted.
+        The transmission object is provided as the value to the
+        :meth:`~simpy.events.Event.succeed` call.
+        """
+        if self._eHeaderCompletes is None:
+            headerStopTime = self.startTime + self.headerDuration
+            self._eHeaderCompletes = SimMan.timeoutUntil(headerStopTime, self)
+        return self._eHeaderCompletes
+
+    @property
+    def eCompletes(self) -> Event:
+        """
+        :class:`~simpy.events.Event`: A SimPy event that succeeds at
+        :attr:`stopTime`, providing the transmission object as the value.
+        """
+        if self._eCompletes is None:
+            self._eCompletes = SimMan.timeoutUntil(self.stopTime, self)
+        return self._eCompletes
+
 
 class FrequencyBandSpec:
     """
     A frequency band specification stores a :class:`FrequencyBand`'s frequency and its bandwidth.
     """
 
+    __slots__ = ("frequency", "bandwidth")
+
     def __init__(self, frequency: float = 2.4e9, bandwidth: float = 22e6):
         """
         Args:
@@ -314,6 +350,8 @@ class AttenuationModel():
     :attr:`attenuationChanged` event succeeds.
     """
 
+    __slots__ = ("frequencyBandSpec", "devices", "attenuation", "nAttenuationChanges")
+
     def __init__(self, frequencyBandSpec: FrequencyBandSpec, deviceA: Device, deviceB: Device):
         """
         Args:
@@ -368,6 +406,8 @@ class PositionalAttenuationModel(AttenuationModel, ABC):
     between the devices does not exceed :attr:`STANDBY_THRESHOLD`.
     """
 
+    __slots__ = ()
+
     STANDBY_THRESHOLD: float = 3000
     """
     float: The minimum distance in metres, that allows the
@@ -381,8 +421,8 @@ class PositionalAttenuationModel(AttenuationModel, ABC):
             device.position.nChange.subscribeCallback(self._positionChangedCallback, additionalArgs=[device])
     
     def _positionChangedCallback(self, position: devices.Position, device: devices.Device):
-            distance = self.devices[0].position.distanceTo(self.devices[1].position)
-            if distance < self.STANDBY_THRESHOLD:
+            squaredDistance = self.devices[0].position.distanceSquaredTo(self.devices[1].position)
+            if squaredDistance < self.STANDBY_THRESHOLD * self.STANDBY_THRESHOLD:
                 self._positionChanged(device)
     
     @abstractmethod
@@ -412,6 +452,8 @@ class JoinedAttenuationModel(AttenuationModel):
     will be triggered as a direct consequence.
     """
 
+    __slots__ = ("_models", "_modelAttenuations", "_attenuationSum", "_updateGatheringActive")
+
     def __init__(self, frequencyBandSpec: FrequencyBandSpec, deviceA: Device, deviceB: Device, models: List[Type[AttenuationModelClass]]):
         """
         Args:
@@ -422,20 +464,18 @@ class JoinedAttenuationModel(AttenuationModel):
             models: A non-empty list of the :class:`AttenuationModel` subclasses
                 to create a :class:`JoinedAttenuationModel` instance of
         """
+        super(JoinedAttenuationModel, self).__init__(frequencyBandSpec, deviceA, deviceB)
+
         # instantiate models
         self._models = [model(frequencyBandSpec, deviceA, deviceB) for model in models]
-        self._modelAttenuations = {}
-
-        for model in self._models:
-            self._modelAttenuations[model] = model.currentAttenuation
-            # define a callback for updating the model's
-            # attenuation value as it changes
-            def updater(newAttenuation: float):
-                self._modelAttenuations[model] = newAttenuation
-                if not self._updateGatheringActive:
-                    # update the sum
-                    self._updateSum()
-            model.nAttenuationChanges.addCallback(updater)
+        # the models' attenuation values, indexed by model position
+        self._modelAttenuations = [model.attenuation for model in self._models]
+        self._attenuationSum = sum(self._modelAttenuations)
+
+        for index, model in enumerate(self._models):
+            # update the model's attenuation value as it changes
+            model.nAttenuationChanges.subscribeCallback(self._modelAttenuationChanged,
+                                                        additionalArgs=[index])
         
         # Setting up callbacks to gather updates that happen as a consequence to
         # position changes
@@ -452,9 +492,18 @@ class JoinedAttenuationModel(AttenuationModel):
         for device in self.devices:
             device.position.nChange.subscribeCallback(beforeUpdates, priority=1)
             device.position.nChange.subscribeCallback(afterUpdates, priority=-1)
+        
+        self._updateSum()
+    
+    def _modelAttenuationChanged(self, newAttenuation: float, index: int):
+        # update the running sum by the model's change only
+        self._attenuationSum += newAttenuation - self._modelAttenuations[index]
+        self._modelAttenuations[index] = newAttenuation
+        if not self._updateGatheringActive:
+            self._updateSum()
     
     def _updateSum(self):
-        self._setAttenuation(sum(self._modelAttenuations.values()))
+        self._setAttenuation(self._attenuationSum)
 
 class AttenuationModelFactory():
     """
@@ -472,7 +521,18 @@ class AttenuationModelFactory():
         self._frequencyBandSpec = frequencyBandSpec
         self._models = models
         self._instances = {}
-        self._customModels: Dict[FrozenSet, List[AttenuationModelClass]] = {}
+        self._customModels: Dict[Tuple[Device, Device], List[AttenuationModelClass]] = {}
+    
+    @staticmethod
+    def _devicePair(deviceA: Device, deviceB: Device) -> Tuple[Device, Device]:
+        """
+        Returns a tuple of `deviceA` and `deviceB` in an order that does not
+        depend on the order of the arguments, so that it can be used as a
+        dict key for the device pair.
+        """
+        if id(deviceA) < id(deviceB):
+            return (deviceA, deviceB)
+        return (deviceB, deviceA)
     
     def setCustomModels(self, deviceA: Device, deviceB: Device, models: List[AttenuationModelClass]):
         """
@@ -492,7 +552,7 @@ class AttenuationModelFactory():
                 that will be used for instantiating attenuation models for signals
                 sent from `deviceA` to `deviceB` and vice versa
         """
-        devicePair = frozenset((deviceA, deviceB))
+        devicePair = self._devicePair(deviceA, deviceB)
         assert devicePair not in self._customModels
         assert devicePair not in self._instances
         self._customModels[devicePair] = models
@@ -505,7 +565,7 @@ class AttenuationModelFactory():
         initialized with multiple :class:`AttenuationModel` subclasses, a
         :class:`JoinedAttenuationModel` will be handed out.
         """
-        devicePair = frozenset((deviceA, deviceB))
+        devicePair = self._devicePair(deviceA, deviceB)
         
         if devicePair in self._instances:
             return self._instances[devicePair]
@@ -516,7 +576,7 @@ class AttenuationModelFactory():
                 models = self._models
             return self._initInstance(models, devicePair)
     
-    def _initInstance(self, modelClasses: List[AttenuationModelClass], devicePair: FrozenSet[Device]):
+    def _initInstance(self, modelClasses: List[AttenuationModelClass], devicePair: Tuple[Device, Device]):
             """
             Initializes a new AttenuationModel instance from the provided class(es)
             """
@@ -535,6 +595,9 @@ class FrequencyBand:
     AttenuationModel for any pair of devices.
     """
 
+    __slots__ = ("spec", "_attenuationModelFactory", "_transmissions", "_transmissionCounter",
+                 "_transmissionInReachNotifiers", "_transmissionInReachList", "nNewTransmission")
+
     def __init__(self, modelClasses: List[AttenuationModelClass], frequency: float = 2.4e9, bandwidth: float = 22e6):
         """
         Args:
@@ -553,8 +616,14 @@ class FrequencyBand:
 
         self._attenuationModelFactory = AttenuationModelFactory(self.spec, modelClasses)
 
-        self._transmissions: Deque[Transmission] = deque()
+        # heap of (stopTime, counter, transmission) tuples for the transmissions
+        # that have not been removed yet
+        self._transmissions: List[Tuple[float, int, Transmission]] = []
+        self._transmissionCounter = count()
         self._transmissionInReachNotifiers: Dict[Tuple[Device, float], Notifier] = {}
+        # (receiver, squared radius, notifier) tuples of the notifiers above,
+        # iterated on each transmission
+        self._transmissionInReachList: List[Tuple[Device, float, Notifier]] = []
 
         self.nNewTransmission: Notifier = Notifier("New transmission", self)
         """
@@ -593,34 +662,41 @@ class FrequencyBand:
         Returns:
             The :class:`Transmission` object representing the transmission
         """
-        self._removeFirstPastTransmission() # regular cleanup
+        self._removePastTransmissions() # regular cleanup
         t = Transmission(sender, power, packet, mcsHeader, mcsPayload, SimMan.now)
-        self._transmissions.append(t)
-        logger.info("%s added", t, sender=self)
+        heapq.heappush(self._transmissions, (t.stopTime, next(self._transmissionCounter), t))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s added", t, sender=self)
         # trigger notifiers after returning the transmission
         def callAfterReturn(value: Any):
             self.nNewTransmission.trigger(t)
             # check which transmissionInReachNotifiers have to be triggered
-            for (receiver, radius), notifier in self._transmissionInReachNotifiers.items():
-                if receiver.position.distanceTo(sender.position) <= radius:
+            # (comparing squared distances to avoid square roots)
+            senderPosition = sender.position
+            senderX, senderY = senderPosition.x, senderPosition.y
+            for receiver, squaredRadius, notifier in self._transmissionInReachList:
+                receiverPosition = receiver.position
+                dx = receiverPosition.x - senderX
+                dy = receiverPosition.y - senderY
+                if dx*dx + dy*dy <= squaredRadius:
                     notifier.trigger(t)
         SimMan.timeout(0).callbacks.append(callAfterReturn)
         return t
     
     def _removePastTransmissions(self):
-        while len(self._transmissions) > 0 and self._transmissions[0].completed:
-            self._transmissions.popleft()
-    
-    def _removeFirstPastTransmission(self):
-        if len(self._transmissions) > 0 and self._transmissions[0].completed:
-            self._transmissions.popleft()
+        # pops completed transmissions in the order of their stop times, so
+        # that a long transmission does not keep shorter ones from being removed
+        transmissions = self._transmissions
+        now = SimMan.now
+        while transmissions and transmissions[0][0] <= now:
+            heapq.heappop(transmissions)
     
     def getActiveTransmissions(self) -> List[Transmission]:
         """
         Returns a list of transmissions that are currently active.
         """
         self._removePastTransmissions()
-        return list(self._transmissions)
+        return [t for _, _, t in self._transmissions]
     
     def getActiveTransmissionsInReach(self, receiver: Device, radius: float) -> List[Transmission]:
         """
@@ -633,7 +709,18 @@ class FrequencyBand:
                 considered
             radius: The radius around the receiver (in metres)
         """
-        return [t for t in self.getActiveTransmissions() if t.sender.position.distanceTo(receiver) <= radius]
+        receiverPosition = receiver.position
+        receiverX, receiverY = receiverPosition.x, receiverPosition.y
+        squaredRadius = radius*radius
+        inReach = []
+        self._removePastTransmissions()
+        for _, _, t in self._transmissions:
+            senderPosition = t.sender.position
+            dx = senderPosition.x - receiverX
+            dy = senderPosition.y - receiverY
+            if dx*dx + dy*dy <= squaredRadius:
+                inReach.append(t)
+        return inReach
     
     def nNewTransmissionInReach(self, receiver: Device, radius: float) -> Notifier:
         """
@@ -652,4 +739,5 @@ class FrequencyBand:
         # creating a new notifier otherwise
         n = Notifier("New Transmission within radius {:d} around {}".format(radius, receiver), self)
         self._transmissionInReachNotifiers[receiver, radius] = n
+        self._transmissionInReachList.append((receiver, radius*radius, n))
         return n
@@ -80,8 +80,9 @@ class SimplePhy(Module):
         self._receivedPower = self._thermalNoisePower
         def updateReceivedPower(delta: float):
             self._receivedPower += delta
-            logger.debug("%s: Received level changed by %s mW, updated to %s mW",
-                            self, delta, self._receivedPower)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s: Received level changed by %s mW, updated to %s mW",
+                                self, delta, self._receivedPower)
         self._nReceivedPowerChanges = Notifier("Received power changes", self)
         self._nReceivedPowerChanges.subscribeCallback(updateReceivedPower, priority=1)
         
@@ -170,7 +171,8 @@ class SimplePhy(Module):
         signalPowerDbm = milliwattsToDbm(signalPower)
         noisePowerDbm = milliwattsToDbm(noisePower)
         self._receivedBitErrorRate = self._currentReceiverMcs.calculateBitErrorRate(signalPowerDbm, noisePowerDbm)
-        logger.debug("Currently simulated bit error rate: " + str(self._receivedBitErrorRate), sender=self)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Currently simulated bit error rate: %s", self._receivedBitErrorRate, sender=self)
 
     def _resetBitErrorCounter(self):
         self._receivedBitErrorSum = 0
@@ -251,8 +253,8 @@ class SimplePhy(Module):
                 yield t.eCompletes
                 self._countBitErrors()
 
-                logger.debug("{:.3} of {:.3} payload bits were errors.".format(
-                                self._receivedBitErrorSum, t.payloadBits), sender=self)
+                logger.debug("%.3g of %.3g payload bits were errors.",
+                                self._receivedBitErrorSum, t.payloadBits, sender=self)
                 
                 # Decide whether the payload could be received
                 if self._decide(self._receivedBitErrorSum, t.payloadBits, t.mcsPayload, logSubject="Payload"):
@@ -275,14 +277,14 @@ class SimplePhy(Module):
         bitErrorRate = bitErrorSum / totalBits
         maxCorrectableBer = mcs.maxCorrectableBer()
         if bitErrorRate <= maxCorrectableBer:
-            logger.info("Decider: {} successfully received "
-                            "(bit error rate: {:.3%})".format(logSubject, bitErrorRate), sender=self)
+            logger.info("Decider: %s successfully received "
+                            "(bit error rate: %.3f%%)", logSubject, bitErrorRate*100, sender=self)
             return True
         else:
-            logger.info("Decider: {} received with uncorectable errors "
-                            "(bit error rate: {:.3%}, max. correctable "
-                            "bit error rate: {:.3%})!".format(logSubject,
-                            bitErrorRate, maxCorrectableBer), sender=self)
+            logger.info("Decider: %s received with uncorectable errors "
+                            "(bit error rate: %.3f%%, max. correctable "
+                            "bit error rate: %.3f%%)!", logSubject,
+                            bitErrorRate*100, maxCorrectableBer*100, sender=self)
             return False
         
 
@@ -379,9 +381,7 @@ class SimpleMac(Module):
         A method for generating unique 6-byte-long MAC addresses (currently counting upwards starting at 1)
         """
         cls._macCounter += 1
-        addr = bytearray(6)
-        addr[5] = cls._macCounter
-        return bytes(addr)
+        return cls._macCounter.to_bytes(6, "big")
     
     @GateListener("phyIn", Packet)
     def phyInHandler(self, packet):
@@ -408,11 +408,13 @@ class SimpleMac(Module):
                     while not timeoutEvent.processed:
                         if len(self._packetQueue) == 0:
                             queuedPackets = False
-                            logger.debug("Packet queue empty, nothing to transmit. Time left: %s s", timeLeft(), sender=self)
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Packet queue empty, nothing to transmit. Time left: %s s", timeLeft(), sender=self)
                             yield self._packetAddedEvent | timeoutEvent
                             if not timeoutEvent.processed:
                                 # new packet was added for sending
-                                logger.debug("Packet queue was refilled. Time left: %s s", timeLeft(), sender=self)
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("Packet queue was refilled. Time left: %s s", timeLeft(), sender=self)
                                 queuedPackets = True
                         if queuedPackets:
                             if not timeLeft() > self._packetQueue[0].transmissionTime(self._mcs.dataRate):
@@ -429,8 +431,9 @@ class SimpleMac(Module):
                                     "mcs": self._mcs
                                 })
                                 self.gates["phyOut"].send(message) # make the PHY send the packet
-                                logger.debug("Transmitting packet. Time left: %s", timeLeft(), sender=self)
-                                logger.debug("Packet: %s", packet, sender=self)
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("Transmitting packet. Time left: %s", timeLeft(), sender=self)
+                                    logger.debug("Packet: %s", packet, sender=self)
                                 yield message.eProcessed # wait until the transmission has completed
             else:
                 # packet from any other device
@@ -460,7 +463,8 @@ class SimpleMac(Module):
                 self._receiveTimeout = SimMan.timeout(cmd.args["duration"])
                 self._receiveTimeout.callbacks.append(self._receiveTimeoutCallback)
 
-        elif isinstance(cmd, Packet):
+        else:
+            # cmd is a Packet (the GateListener only passes Message and Packet objects)
             payload = cmd
             packet = Packet(
                 SimpleMacHeader(self.addr, payload.header.destMAC, flag=0),
@@ -255,7 +255,8 @@ class Notifier:
         self._priorityToCallbacks: DefaultDict[int, Set[Callable[[Any], None]]] = defaultdict(set)
         self._callbackToPriority: Dict[Callable[[Any], None], int] = {}
         self._callbackToAdditionalArgs: Dict[Callable[[Any], None], Any] = {}
-        self._sortedCallbacks = [] # List of callbacks sorted by their priority
+        # Tuple of (callback, additionalArgs) pairs sorted by callback priority
+        self._sortedCallbacks: Tuple[Tuple[Callable[[Any], None], Tuple], ...] = ()
 
         # SimPy generators
         self._processExecutors = {}
@@ -303,18 +304,22 @@ class Notifier:
 
         priority = self._callbackToPriority.pop(callback)
         self._priorityToCallbacks[priority].remove(callback)
-        self._updateSortedCallbacks()
 
         if callback in self._callbackToAdditionalArgs:
             self._callbackToAdditionalArgs.pop(callback)
+        
+        self._updateSortedCallbacks()
     
     def _updateSortedCallbacks(self):
         """
-        Rebuilds the :attr:`_sortedCallbacks` list
+        Rebuilds the :attr:`_sortedCallbacks` tuple. Additional arguments are
+        resolved here, so that :meth:`trigger` does not have to look them up
+        for every callback invocation.
         """
         sortedPriorities = sorted(self._priorityToCallbacks.keys(), reverse=True)
-        self._sortedCallbacks = list(
-            itertools.chain(
+        self._sortedCallbacks = tuple(
+            (callback, tuple(self._callbackToAdditionalArgs.get(callback, ())))
+            for callback in itertools.chain(
                 *[self._priorityToCallbacks[p] for p in sortedPriorities]
             )
         )
@@ -397,14 +402,11 @@ class Notifier:
         :attr:`event` succeed, and triggers the processing of subscribed SimPy
         generators.
         """
-        logger.debug("Triggered with value %s", value, sender=self)
-        for callback in self._sortedCallbacks:
-            if callback in self._callbackToAdditionalArgs:
-                args = self._callbackToAdditionalArgs[callback]
-                callback(value, *args)
-            else:
-                callback(value)
-            
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Triggered with value %s", value, sender=self)
+        for callback, args in self._sortedCallbacks:
+            callback(value, *args)
+
         for executor in self._processExecutors.values():
             executor(value)
         if self._event is not None:
@@ -1,4 +1,5 @@
 import logging
+from fractions import Fraction
 from math import log10
 from typing import Iterable, List
 
@@ -233,3 +234,73 @@ def test_simple_mac(caplog, simple_mac):
     # Both devices should have received 10 packets
     assert len(receivedPackets1) == 10
     assert len(receivedPackets2) == 10
+
+def test_mac_addresses():
+    addresses = [SimpleMac.newMacAddress() for _ in range(300)]
+
+    assert all(len(addr) == 6 for addr in addresses)
+    # addresses remain unique when the counter exceeds a single byte
+    assert len(set(addresses)) == len(addresses)
+    assert SimpleMac.rrmAddr not in addresses
+
+def test_max_correctable_ber():
+    for codeRate, expectedBer in [(Fraction(1,2), 0.5), (Fraction(3,4), 0.25),
+                                  (Fraction(2,3), 1/3), (Fraction(7,8), 0.125),
+                                  (Fraction(11,16), 0.125)]:
+        assert BpskMcs(None, codeRate).maxCorrectableBer() == pytest.approx(expectedBer)
+
+def test_joined_attenuation_model():
+    SimMan.init()
+    device1 = Device("1", 0, 0)
+    device2 = Device("2", 3, 4)
+    fspl = FrequencyBand([FsplAttenuation]).getAttenuationModel(device1, device2)
+    joined = FrequencyBand([FsplAttenuation, FsplAttenuation]).getAttenuationModel(device1, device2)
+    assert joined.attenuation == pytest.approx(2*fspl.attenuation)
+
+    attenuationUpdates = []
+    joined.nAttenuationChanges.subscribeCallback(attenuationUpdates.append)
+    device2.position.x = 6
+    # both model updates are gathered into a single notification
+    assert attenuationUpdates == [pytest.approx(2*fspl.attenuation)]
+
+def test_active_transmissions_in_reach(simple_phy):
+    s = simple_phy
+    packet = Packet(FakeTransmittable(8), FakeTransmittable(128))
+    mcs = BpskMcs(s.frequencyBand.spec)
+    t = s.frequencyBand.transmit(s.device1, 0.0, packet, mcs, mcs)
+    assert s.frequencyBand.getActiveTransmissionsInReach(s.device2, 2) == [t]
+    assert s.frequencyBand.getActiveTransmissionsInReach(s.device2, 1) == []
+
+def test_active_transmissions():
+    SimMan.init()
+    frequencyBand = FrequencyBand([FsplAttenuation])
+    mcs = BpskMcs(frequencyBand.spec)
+    longPacket = Packet(FakeTransmittable(8), FakeTransmittable(128))
+    shortPacket = Packet(FakeTransmittable(8), FakeTransmittable(8))
+    longTransmission = frequencyBand.transmit(Device("1", 0, 0), 0.0, longPacket, mcs, mcs)
+    shortTransmission = frequencyBand.transmit(Device("2", 1, 1), 0.0, shortPacket, mcs, mcs)
+    assert len(frequencyBand.getActiveTransmissions()) == 2
+
+    # the short transmission completes while the long one is still active
+    SimMan.runSimulation(shortTransmission.stopTime)
+    assert frequencyBand.getActiveTransmissions() == [longTransmission]
+
+    SimMan.runSimulation(longTransmission.stopTime - SimMan.now)
+    assert frequencyBand.getActiveTransmissions() == []
+
+def test_new_transmission_in_reach():
+    SimMan.init()
+    frequencyBand = FrequencyBand([FsplAttenuation])
+    mcs = BpskMcs(frequencyBand.spec)
+    sender = Device("Sender", 0, 0)
+    receiver = Device("Receiver", 3, 4)
+
+    inReach, outOfReach = [], []
+    frequencyBand.nNewTransmissionInReach(receiver, 5).subscribeCallback(inReach.append)
+    frequencyBand.nNewTransmissionInReach(receiver, 4).subscribeCallback(outOfReach.append)
+
+    packet = Packet(FakeTransmittable(8), FakeTransmittable(8))
+    t = frequencyBand.transmit(sender, 0.0, packet, mcs, mcs)
+    SimMan.runSimulation(t.stopTime)
+    assert inReach == [t]
+    assert outOfReach == []